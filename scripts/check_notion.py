@@ -1,42 +1,65 @@
 import os
 import re
 import hashlib
-import difflib
+import mmap
 import uuid
+from collections.abc import Iterable, Iterator
+from itertools import takewhile
+import fast_diff_match_patch
 from playwright.sync_api import sync_playwright
 
-NOTION_URL = os.environ["NOTION_URL"]
+NOTION_URL = os.environ.get("NOTION_URL", "")
+# Several pages can share one browser: NOTION_URLS="https://a,https://b"
+NOTION_URLS = [u.strip() for u in os.environ.get("NOTION_URLS", NOTION_URL).split(",") if u.strip()]
 
 STATE_HASH_FILE = os.environ.get("STATE_FILE", "state/notion.sha256")
 STATE_SNAPSHOT_FILE = os.environ.get("SNAPSHOT_FILE", "state/notion.txt")
 DIFF_FILE = os.environ.get("DIFF_FILE", "state/notion.diff")
 CHANGES_FILE = os.environ.get("CHANGES_FILE", "state/notion.changes.txt")
+_STATE_DIRS = {os.path.dirname(p) for p in (STATE_HASH_FILE, STATE_SNAPSHOT_FILE, DIFF_FILE, CHANGES_FILE)} - {""}
 
 MAX_CHANGE_ITEMS = int(os.environ.get("MAX_CHANGE_ITEMS", "25"))
 MAX_BLOCK_LINES = int(os.environ.get("MAX_BLOCK_LINES", "6"))
 
+# Only runs that actually change: 2+ blanks or any tab, not every lone space.
+_RE_HSPACE = re.compile(r" [ \t]+|\t[ \t]*")
+# Blank lines, including ones left holding a single space after _RE_HSPACE
+_RE_VSPACE = re.compile(r"\n(?: ?\n)+")
+_LOGIN_RE = re.compile(r"log in|continue with|sign up|create account", re.IGNORECASE)
 
-def set_output(key: str, value: str) -> None:
-    out = os.environ.get("GITHUB_OUTPUT")
-    if not out:
-        return
-    with open(out, "a", encoding="utf-8") as f:
-        f.write(f"{key}={value}\n")
+# Subtrees whose text never counts as page content (readiness check and extractor)
+_SKIP_SELECTOR = 'script, style, noscript, template, [hidden], [aria-hidden="true"]'
+
+# Images, fonts and media are not needed for text extraction. Matched by URL so
+# only these requests reach Python; documents, scripts, styles and XHR load as is.
+_BLOCKED_URL_RE = re.compile(
+    r"\.(?:png|jpe?g|gif|webp|avif|svg|ico|woff2?|ttf|otf|eot|mp4|webm|mov|mp3|wav|ogg)(?:[?#]|$)",
+    re.IGNORECASE,
+)
 
 
-def set_output_multiline(key: str, value: str) -> None:
+def set_outputs(outputs: dict[str, str]) -> None:
     out = os.environ.get("GITHUB_OUTPUT")
     if not out:
         return
-    delim = f"EOF_{uuid.uuid4().hex}"
-    with open(out, "a", encoding="utf-8") as f:
-        f.write(f"{key}<<{delim}\n")
-        f.write(value.rstrip("\n") + "\n")
-        f.write(f"{delim}\n")
-
-
-def sha256_hex(s: str) -> str:
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+    # One open/flush for every output; multi-line values use a heredoc delimiter
+    with open(out, "a", encoding="utf-8", buffering=1 << 14) as f:
+        for key, value in outputs.items():
+            if "\n" in value:
+                delim = f"EOF_{uuid.uuid4().hex}"
+                f.write(f"{key}<<{delim}\n")
+                f.write(value.rstrip("\n") + "\n")
+                f.write(f"{delim}\n")
+            else:
+                f.write(f"{key}={value}\n")
+
+
+def sha256_hex(data: bytes, chunk_size: int = 1 << 16) -> str:
+    h = hashlib.sha256()
+    view = memoryview(data)
+    for start in range(0, len(view), chunk_size):
+        h.update(view[start:start + chunk_size])
+    return h.hexdigest()
 
 
 def read_file(path: str) -> str:
@@ -47,16 +70,33 @@ def read_file(path: str) -> str:
         return ""
 
 
+def snapshot_matches(path: str, data: bytes) -> bool:
+    # Stored snapshots are `data + b"\n"`; compare in the page cache via mmap
+    # instead of reading and decoding the old file.
+    try:
+        with open(path, "rb") as f:
+            if not data or os.fstat(f.fileno()).st_size != len(data) + 1:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm[-1] == ord("\n") and mm.find(data, 0, len(data)) == 0
+    except FileNotFoundError:
+        return False
+
+
 def write_file(path: str, content: str) -> None:
-    os.makedirs(os.path.dirname(path), exist_ok=True)
     with open(path, "w", encoding="utf-8") as f:
         f.write(content)
 
 
+def write_bytes(path: str, *chunks: bytes) -> None:
+    with open(path, "wb") as f:
+        f.writelines(chunks)
+
+
 def normalize_text(text: str) -> str:
-    text = text.replace("\r\n", "\n")
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n{2,}", "\n", text)
+    text = text.replace("\r", "")
+    text = _RE_HSPACE.sub(" ", text)
+    text = _RE_VSPACE.sub("\n", text)
     return text.strip()
 
 
@@ -65,84 +105,308 @@ def auto_scroll(page) -> None:
         """
         async () => {
           await new Promise((resolve) => {
-            let total = 0;
-            const distance = 800;
-            const timer = setInterval(() => {
-              window.scrollBy(0, distance);
-              total += distance;
-              if (total >= document.body.scrollHeight) {
-                clearInterval(timer);
+            const deadline = Date.now() + 8000;
+            let lastHeight = 0;
+            let stableFrames = 0;
+            const step = () => {
+              window.scrollBy(0, window.innerHeight);
+              const height = document.body.scrollHeight;
+              stableFrames = height === lastHeight ? stableFrames + 1 : 0;
+              lastHeight = height;
+              const atBottom = window.scrollY + window.innerHeight >= height - 1;
+              if ((atBottom && stableFrames >= 10) || Date.now() > deadline) {
                 resolve();
+                return;
               }
-            }, 200);
+              requestAnimationFrame(step);
+            };
+            requestAnimationFrame(step);
           });
         }
         """
     )
 
 
-def extract_text_with_playwright(url: str) -> str:
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        page.set_default_navigation_timeout(120_000)
-        page.set_default_timeout(60_000)
+def open_browser():
+    pw = sync_playwright().start()
+    browser = pw.chromium.launch(headless=True)
+    context = browser.new_context()
+    context.set_default_navigation_timeout(120_000)
+    context.set_default_timeout(60_000)
+    # Note: any route turns off Playwright's HTTP cache for the context, so
+    # shared JS bundles are fetched again per page in NOTION_URLS mode.
+    context.route(_BLOCKED_URL_RE, lambda route: route.abort())
+    return pw, browser, context
+
 
+def close_browser(pw, browser, context) -> None:
+    context.close()
+    browser.close()
+    pw.stop()
+
+
+def scrape(context, url: str) -> str:
+    page = context.new_page()
+    try:
         page.goto(url, wait_until="domcontentloaded", timeout=120_000)
-        page.wait_for_timeout(5000)
 
+        # Poll for rendered Notion blocks holding some real text (script/style
+        # text excluded) instead of sleeping a fixed time
         try:
-            page.wait_for_selector("main", timeout=30_000)
+            page.wait_for_function(
+                """
+                (skip) => {
+                  if (!document.querySelector('.notion-page-content, [data-block-id]')) return false;
+                  const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_ELEMENT | NodeFilter.SHOW_TEXT, {
+                    acceptNode: (n) => n.nodeType === Node.TEXT_NODE
+                      ? NodeFilter.FILTER_ACCEPT
+                      : (n.matches(skip) ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_SKIP),
+                  });
+                  let length = 0;
+                  for (let n = walker.nextNode(); n; n = walker.nextNode()) {
+                    length += n.data.trim().length;
+                    if (length > 200) return true;
+                  }
+                  return false;
+                }
+                """,
+                arg=_SKIP_SELECTOR,
+                timeout=30_000,
+            )
         except Exception:
             pass
 
         auto_scroll(page)
-        page.wait_for_timeout(2000)
 
-        text = page.evaluate("() => document.body ? document.body.innerText : ''")
-        browser.close()
+        # Done once the page height is the same on two polls 250ms apart
+        try:
+            page.wait_for_function(
+                """
+                () => {
+                  const h = document.body.scrollHeight;
+                  const stable = window.__lastScrollHeight === h;
+                  window.__lastScrollHeight = h;
+                  return stable;
+                }
+                """,
+                polling=250,
+                timeout=10_000,
+            )
+        except Exception:
+            pass
+
+        # Walk text nodes (no layout, unlike innerText), one line per block,
+        # table cells tab-separated, <br> as a newline, hidden subtrees skipped
+        text = page.evaluate(
+            """
+            (SKIP) => {
+              if (!document.body) return '';
+              const BLOCK = '[data-block-id], h1, h2, h3, p, li, td, th';
+              const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_ELEMENT | NodeFilter.SHOW_TEXT, {
+                acceptNode: (n) => {
+                  if (n.nodeType === Node.TEXT_NODE) return NodeFilter.FILTER_ACCEPT;
+                  if (n.matches(SKIP)) return NodeFilter.FILTER_REJECT;
+                  return n.tagName === 'BR' ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_SKIP;
+                },
+              });
+              const parts = [];
+              let block = null;
+              for (let n = walker.nextNode(); n; n = walker.nextNode()) {
+                if (n.nodeType === Node.ELEMENT_NODE) {
+                  parts.push('\\n');
+                  continue;
+                }
+                const b = n.parentElement.closest(BLOCK) || n.parentElement;
+                if (parts.length && b !== block) {
+                  const sameRow = block && b.matches('td, th') && block.parentElement === b.parentElement;
+                  parts.push(sameRow ? '\\t' : '\\n');
+                }
+                block = b;
+                parts.push(n.data);
+              }
+              return parts.length ? parts.join('') : document.body.innerText;
+            }
+            """,
+            _SKIP_SELECTOR,
+        )
+    finally:
+        page.close()
 
     text = normalize_text(text)
 
-    login_signals = ["Log in", "Continue with", "Sign up", "Create account"]
-    if any(sig.lower() in text.lower() for sig in login_signals):
-        raise SystemExit("Login wall detected. The Notion page is likely not public (Share to web).")
+    if _LOGIN_RE.search(text):
+        raise SystemExit(f"Login wall detected on {url}. The Notion page is likely not public (Share to web).")
 
     return text
 
 
-def make_unified_diff(old_text: str, new_text: str) -> list[str]:
-    return list(
-        difflib.unified_diff(
-            old_text.splitlines(),
-            new_text.splitlines(),
-            fromfile="before",
-            tofile="after",
-            lineterm=""
-        )
+def _line_tokens(old_lines: list[str], new_lines: list[str]) -> tuple[str, str]:
+    # Map every distinct line to one code point (skipping surrogates) so the
+    # C++ diff core compares whole lines instead of characters.
+    ids: dict[str, str] = {}
+
+    def encode(lines: list[str]) -> str:
+        out = []
+        for line in lines:
+            tok = ids.get(line)
+            if tok is None:
+                n = len(ids)
+                tok = ids[line] = chr(n if n < 0xD800 else n + 0x800)
+            out.append(tok)
+        return "".join(out)
+
+    return encode(old_lines), encode(new_lines)
+
+
+def _common_len(a, b) -> int:
+    return sum(1 for _ in takewhile(lambda pair: pair[0] == pair[1], zip(a, b)))
+
+
+def _trim_common(old_lines: list[str], new_lines: list[str]) -> tuple[int, list[str], list[str], int]:
+    prefix_len = _common_len(old_lines, new_lines)
+    limit = min(len(old_lines), len(new_lines)) - prefix_len
+    suffix_len = min(_common_len(reversed(old_lines), reversed(new_lines)), limit)
+    return (
+        prefix_len,
+        old_lines[prefix_len:len(old_lines) - suffix_len],
+        new_lines[prefix_len:len(new_lines) - suffix_len],
+        suffix_len,
     )
 
 
-def diff_summary(diff_lines: list[str]) -> tuple[int, int]:
-    added = 0
-    removed = 0
-    for line in diff_lines:
-        if line.startswith("+++ ") or line.startswith("--- ") or line.startswith("@@"):
-            continue
-        if line.startswith("+"):
-            added += 1
-        elif line.startswith("-"):
-            removed += 1
-    return added, removed
+def _mid_opcodes(old_mid: list[str], new_mid: list[str], offset: int) -> list[tuple[str, int, int, int, int]]:
+    i = j = offset
+
+    # Pure inserts/deletes and one-line edits (the usual Notion tweak) need no diff
+    if not old_mid or not new_mid or (len(old_mid) == 1 and len(new_mid) == 1):
+        if not old_mid and not new_mid:
+            return []
+        tag = "replace" if old_mid and new_mid else ("delete" if old_mid else "insert")
+        return [(tag, i, i + len(old_mid), j, j + len(new_mid))]
 
+    old_tok, new_tok = _line_tokens(old_mid, new_mid)
+    # Like SequenceMatcher(autojunk=False): no heuristic that trades hunk quality
+    # for speed, so no semantic cleanup (it merges unchanged lines into edits)
+    diffs = fast_diff_match_patch.diff(old_tok, new_tok, checklines=False, cleanup="No", counts_only=True)
 
-def prev_nonempty_line(lines: list[str], idx: int, lookback: int = 25) -> str:
-    k = min(idx - 1, len(lines) - 1)
-    for i in range(k, max(-1, k - lookback), -1):
-        s = lines[i].strip()
+    opcodes = []
+    for op, n in diffs:
+        if op == "=":
+            opcodes.append(("equal", i, i + n, j, j + n))
+            i += n
+            j += n
+            continue
+        if op == "-":
+            i1, i2, j1, j2 = i, i + n, j, j
+            i += n
+        else:
+            i1, i2, j1, j2 = i, i, j, j + n
+            j += n
+        # a delete next to an insert is a replace, like SequenceMatcher reports it
+        if opcodes and opcodes[-1][0] != "equal":
+            _, pi1, _, pj1, _ = opcodes.pop()
+            opcodes.append(("replace", pi1, i, pj1, j))
+        else:
+            opcodes.append(("delete" if op == "-" else "insert", i1, i2, j1, j2))
+    return opcodes
+
+
+def line_opcodes(old_lines: list[str], new_lines: list[str]) -> list[tuple[str, int, int, int, int]]:
+    # Only the changed middle goes through the diff; unchanged head/tail lines
+    # become plain "equal" opcodes.
+    prefix_len, old_mid, new_mid, suffix_len = _trim_common(old_lines, new_lines)
+
+    opcodes = []
+    if prefix_len:
+        opcodes.append(("equal", 0, prefix_len, 0, prefix_len))
+    opcodes += _mid_opcodes(old_mid, new_mid, prefix_len)
+    if suffix_len:
+        i = prefix_len + len(old_mid)
+        j = prefix_len + len(new_mid)
+        opcodes.append(("equal", i, i + suffix_len, j, j + suffix_len))
+    return opcodes
+
+
+def grouped_opcodes(opcodes: list[tuple[str, int, int, int, int]], n: int = 3):
+    # Same hunk grouping as difflib.SequenceMatcher.get_grouped_opcodes
+    codes = list(opcodes) or [("equal", 0, 1, 0, 1)]
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+    group = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > 2 * n:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+
+def hunk_range(start: int, stop: int) -> str:
+    length = stop - start
+    if length == 1:
+        return f"{start + 1}"
+    return f"{start + 1 if length else start},{length}"
+
+
+def make_unified_diff(old_text: str, new_text: str) -> Iterator[str]:
+    old_lines = old_text.splitlines()
+    new_lines = new_text.splitlines()
+
+    started = False
+    for group in grouped_opcodes(line_opcodes(old_lines, new_lines)):
+        if not started:
+            started = True
+            yield "--- before"
+            yield "+++ after"
+        first, last = group[0], group[-1]
+        yield f"@@ -{hunk_range(first[1], last[2])} +{hunk_range(first[3], last[4])} @@"
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in old_lines[i1:i2]:
+                    yield " " + line
+                continue
+            for line in old_lines[i1:i2]:
+                yield "-" + line
+            for line in new_lines[j1:j2]:
+                yield "+" + line
+
+
+def write_diff(path: str, diff_lines: Iterable[str]) -> tuple[int, int]:
+    # Write and count in one pass; "--- before" / "+++ after" are the only
+    # header lines and "@@" hunk lines fall outside both counts.
+    added = removed = 0
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        for line in diff_lines:
+            f.write(line)
+            f.write("\n")
+            if line[0] == "+":
+                added += 1
+            elif line[0] == "-":
+                removed += 1
+    if not added:
+        return 0, 0
+    return added - 1, removed - 1
+
+
+def _context_index(lines: list[str], lookback: int = 25) -> list[str]:
+    # out[i] is the nearest non-empty, non-"notion" line among the `lookback`
+    # lines before index i, so opcode context is an O(1) lookup.
+    out = [""] * (len(lines) + 1)
+    last, last_i = "", -lookback - 1
+    for i, line in enumerate(lines):
+        s = line.strip()
         if s and s.lower() != "notion":
-            return s
-    return ""
+            last, last_i = s, i
+        out[i + 1] = last if i - last_i < lookback else ""
+    return out
 
 
 def clip_block(block: list[str], max_lines: int) -> str:
@@ -155,18 +419,21 @@ def clip_block(block: list[str], max_lines: int) -> str:
 
 
 def build_change_report(old_text: str, new_text: str) -> tuple[str, str]:
+    if old_text == new_text:
+        return ("No visible text changes detected.", "No changes")
+
     old_lines = old_text.splitlines()
     new_lines = new_text.splitlines()
 
-    sm = difflib.SequenceMatcher(None, old_lines, new_lines)
-    opcodes = sm.get_opcodes()
+    opcodes = [op for op in line_opcodes(old_lines, new_lines) if op[0] != "equal"]
+    if not opcodes:
+        return ("No visible text changes detected.", "No changes")
+    new_ctx = _context_index(new_lines)
+    old_ctx = _context_index(old_lines)
 
     items = []
     for tag, i1, i2, j1, j2 in opcodes:
-        if tag == "equal":
-            continue
-
-        context = prev_nonempty_line(new_lines, j1) or prev_nonempty_line(old_lines, i1)
+        context = new_ctx[j1] or old_ctx[i1]
 
         old_block = old_lines[i1:i2]
         new_block = new_lines[j1:j2]
@@ -207,36 +474,106 @@ def build_change_report(old_text: str, new_text: str) -> tuple[str, str]:
     return (report, brief)
 
 
-def main() -> None:
-    old_hash = read_file(STATE_HASH_FILE).strip()
-    old_snapshot = read_file(STATE_SNAPSHOT_FILE)
+def state_path(path: str, key: str) -> str:
+    if not key:
+        return path
+    head, tail = os.path.split(path)
+    stem, dot, ext = tail.partition(".")
+    return os.path.join(head, f"{stem}-{key}{dot}{ext}")
+
+
+def check_page(url: str, snapshot: str, key: str = "") -> dict:
+    hash_file = state_path(STATE_HASH_FILE, key)
+    snapshot_file = state_path(STATE_SNAPSHOT_FILE, key)
 
-    snapshot = extract_text_with_playwright(NOTION_URL)
-    new_hash = sha256_hex(snapshot)
+    old_hash = read_file(hash_file).strip()
+    snapshot_bytes = snapshot.encode("utf-8")
 
-    first_run = (old_hash == "") or (old_snapshot.strip() == "")
-    changed = (not first_run) and (old_hash != new_hash)
+    # An identical page needs no decode, hash, diff or state rewrite
+    if old_hash and snapshot_matches(snapshot_file, snapshot_bytes):
+        first_run = False
+        state_updated = False
+        new_hash = old_hash
+        changed = False
+        diff_lines = ()
+        change_report, change_brief = ("No visible text changes detected.", "No changes")
+    else:
+        old_snapshot = read_file(snapshot_file)
+        first_run = (old_hash == "") or (old_snapshot.strip() == "")
+        state_updated = True
 
-    diff_lines = make_unified_diff(old_snapshot, snapshot)
-    added, removed = diff_summary(diff_lines)
+        new_hash = sha256_hex(snapshot_bytes)
+        changed = (not first_run) and (old_hash != new_hash)
 
-    change_report, change_brief = build_change_report(old_snapshot, snapshot)
+        diff_lines = make_unified_diff(old_snapshot, snapshot)
 
-    # Write state (tracked)
-    write_file(STATE_HASH_FILE, new_hash + "\n")
-    write_file(STATE_SNAPSHOT_FILE, snapshot + "\n")
+        change_report, change_brief = build_change_report(old_snapshot, snapshot)
 
-    # Write files for email attachments
-    write_file(DIFF_FILE, "\n".join(diff_lines) + ("\n" if diff_lines else ""))
-    write_file(CHANGES_FILE, change_report + "\n")
+        # Write state (tracked)
+        write_file(hash_file, new_hash + "\n")
+        write_bytes(snapshot_file, snapshot_bytes, b"\n")
 
-    set_output("old_hash", old_hash)
-    set_output("new_hash", new_hash)
-    set_output("first_run", "true" if first_run else "false")
-    set_output("changed", "true" if changed else "false")
-    set_output("diff_summary", f"+{added} / -{removed}")
-    set_output("change_brief", change_brief)
-    set_output_multiline("change_report", change_report)
+    # Write files for email attachments (always, a forced email attaches them)
+    added, removed = write_diff(state_path(DIFF_FILE, key), diff_lines)
+    write_file(state_path(CHANGES_FILE, key), change_report + "\n")
+
+    return {
+        "url": url,
+        "old_hash": old_hash,
+        "new_hash": new_hash,
+        "first_run": first_run,
+        "changed": changed,
+        "state_updated": state_updated,
+        "added": added,
+        "removed": removed,
+        "change_report": change_report,
+        "change_brief": change_brief,
+    }
+
+
+def main() -> None:
+    if not NOTION_URLS:
+        raise SystemExit("Set NOTION_URL (or NOTION_URLS) to the public Notion page URL.")
+
+    # One browser and context for every page; per-page state files get a key
+    # only when several pages are watched.
+    pw, browser, context = open_browser()
+    try:
+        snapshots = [scrape(context, url) for url in NOTION_URLS]
+    finally:
+        close_browser(pw, browser, context)
+
+    # write_file/write_bytes expect the output directories to exist
+    for d in _STATE_DIRS:
+        os.makedirs(d, exist_ok=True)
+
+    # NOTION_URL keeps the unkeyed state/notion.* files so its history carries
+    # over; other pages get a short URL-hash key.
+    multi = len(NOTION_URLS) > 1
+    results = [
+        check_page(url, snapshot, sha256_hex(url.encode("utf-8"))[:12] if multi and url != NOTION_URL else "")
+        for url, snapshot in zip(NOTION_URLS, snapshots)
+    ]
+
+    if multi:
+        change_report = "\n\n".join(f"URL: {r['url']}\n{r['change_report']}" for r in results)
+        # The email attaches CHANGES_FILE; give it every page's report
+        write_file(CHANGES_FILE, change_report + "\n")
+    else:
+        change_report = results[0]["change_report"]
+    change_brief = next((r["change_brief"] for r in results if r["changed"]), results[0]["change_brief"])
+
+    set_outputs({
+        "old_hash": ",".join(r["old_hash"] for r in results),
+        "new_hash": ",".join(r["new_hash"] for r in results),
+        "first_run": "true" if all(r["first_run"] for r in results) else "false",
+        "changed": "true" if any(r["changed"] for r in results) else "false",
+        # True whenever new state was written (first run of a page, or a change)
+        "state_updated": "true" if any(r["state_updated"] for r in results) else "false",
+        "diff_summary": f"+{sum(r['added'] for r in results)} / -{sum(r['removed'] for r in results)}",
+        "change_brief": change_brief,
+        "change_report": change_report,
+    })
 
 
 if __name__ == "__main__":
@@ -0,0 +1,61 @@
+import difflib
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+import check_notion  # noqa: E402
+
+
+def _edit_size(opcodes) -> int:
+    return sum((i2 - i1) + (j2 - j1) for tag, i1, i2, j1, j2 in opcodes if tag != "equal")
+
+
+def _random_edit(rng: random.Random) -> tuple[list[str], list[str]]:
+    old = [rng.choice("abcdefg") for _ in range(rng.randint(0, 30))]
+    new = list(old)
+    for _ in range(rng.randint(1, 5)):
+        if new and rng.random() < 0.5:
+            new[rng.randrange(len(new))] = rng.choice("abcdefgxyz")
+        else:
+            new.insert(rng.randint(0, len(new)), rng.choice("xyz"))
+    return old, new
+
+
+def test_normalize_text_drops_whitespace_only_lines():
+    assert check_notion.normalize_text("A\n \nB") == "A\nB"
+    assert check_notion.normalize_text("A\n\t \n\n  \nB") == "A\nB"
+    assert check_notion.normalize_text(" A  \t b\r\n\r\nC ") == "A b\nC"
+
+
+def test_number_tweaks_are_one_line_replaces(tmp_path):
+    old = "Pricing\nPrice\n10\nQty\n5\nFooter"
+    new = "Pricing\nPrice\n12\nQty\n6\nFooter"
+
+    report, brief = check_notion.build_change_report(old, new)
+    assert report == "What changed:\n• Price: 10 → 12\n\n• Qty: 5 → 6"
+    assert brief == "• Price: 10 → 12"
+
+    diff_lines = list(check_notion.make_unified_diff(old, new))
+    assert " Qty" in diff_lines
+    assert check_notion.write_diff(str(tmp_path / "notion.diff"), diff_lines) == (2, 2)
+
+
+def test_line_diff_is_never_larger_than_difflib():
+    rng = random.Random(0)
+    for _ in range(3000):
+        old, new = _random_edit(rng)
+        opcodes = check_notion.line_opcodes(old, new)
+        expected = difflib.SequenceMatcher(None, old, new, autojunk=False).get_opcodes()
+        assert _edit_size(opcodes) <= _edit_size(expected), (old, new)
+
+
+def test_unified_diff_matches_difflib_format():
+    rng = random.Random(1)
+    for _ in range(3000):
+        old, new = _random_edit(rng)
+        if check_notion.line_opcodes(old, new) != difflib.SequenceMatcher(None, old, new, autojunk=False).get_opcodes():
+            continue
+        expected = list(difflib.unified_diff(old, new, fromfile="before", tofile="after", lineterm=""))
+        assert list(check_notion.make_unified_diff("\n".join(old), "\n".join(new))) == expected